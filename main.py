@@ -5,7 +5,7 @@ import sys
 from pathlib import Path
 
 from hand_gesture_game import HandGestureGameError, RockPaperScissors
-from hand_gesture_game.utils.logging_config import setup_logging
+from hand_gesture_game.utils.logging_config import setup_logging, shutdown_logging
 
 
 def main() -> None:
@@ -22,8 +22,8 @@ def main() -> None:
     setup_logging(str(log_file), level=logging.INFO)
 
     try:
-        game = RockPaperScissors()
-        game.run()
+        with RockPaperScissors() as game:
+            game.run()
     except HandGestureGameError as e:
         print(f"Game error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -33,6 +33,8 @@ def main() -> None:
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":
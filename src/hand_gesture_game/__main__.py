@@ -14,8 +14,8 @@ def main() -> None:
     It handles any game-related exceptions and ensures proper cleanup.
     """
     try:
-        game = RockPaperScissors()
-        game.run()
+        with RockPaperScissors() as game:
+            game.run()
     except HandGestureGameError as e:
         print(f"Game error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1,8 +1,10 @@
 """Main game module for the Rock Paper Scissors hand gesture game."""
 
 import random
+import sys
+import threading
 import time
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import mediapipe as mp
@@ -14,6 +16,37 @@ from .gesture_detector import Gesture, GestureDetector
 
 logger = get_logger(__name__)
 
+# Capture settings requested from the camera driver
+CAMERA_INDEX = 0
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 480
+CAMERA_BUFFER_SIZE = 1
+
+# Width frames are downscaled to before hand inference
+INFERENCE_WIDTH = 256
+
+# Minimum seconds between gesture inferences while counting down
+COUNTDOWN_INFERENCE_INTERVAL = 0.2
+
+# Consecutive identical detections required to confirm the player's gesture
+GESTURE_CONFIRM_FRAMES = 3
+
+# Minimum seconds between window updates (~30 Hz)
+DISPLAY_INTERVAL = 1 / 30
+
+# _PLAYER_WINS[player.value, computer.value] is True when the player wins
+_PLAYER_WINS = np.zeros((3, 3), dtype=bool)
+_PLAYER_WINS[Gesture.ROCK.value, Gesture.SCISSORS.value] = True
+_PLAYER_WINS[Gesture.PAPER.value, Gesture.ROCK.value] = True
+_PLAYER_WINS[Gesture.SCISSORS.value, Gesture.PAPER.value] = True
+
+# Landmark index pairs of the hand skeleton, one row per connection
+_CONN_INDEX = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.intp)
+
+# Gestures the computer picks from, and a generator private to the game
+_GESTURES: Tuple[Gesture, ...] = tuple(Gesture)
+_RNG = random.Random()
+
 
 class GameState:
     """Enumeration of possible game states."""
@@ -24,6 +57,142 @@ class GameState:
     RESULT = "RESULT"
 
 
+class Score:
+    """
+    Player and computer scores.
+
+    A fixed-slot container so score updates and reads are plain attribute
+    accesses rather than dictionary lookups.
+
+    Attributes:
+        player: Number of rounds won by the player
+        computer: Number of rounds won by the computer
+    """
+
+    __slots__ = ("player", "computer")
+
+    def __init__(self, player: int = 0, computer: int = 0) -> None:
+        """
+        Initialize the scores.
+
+        Args:
+            player: Initial player score
+            computer: Initial computer score
+        """
+        self.player = player
+        self.computer = computer
+
+    def __eq__(self, other: object) -> bool:
+        """Compare scores by value."""
+        if not isinstance(other, Score):
+            return NotImplemented
+        return self.player == other.player and self.computer == other.computer
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the scores."""
+        return f"Score(player={self.player}, computer={self.computer})"
+
+
+def _ensure_buffer(
+    buffer: Optional[np.ndarray], shape: Tuple[int, ...], dtype: type = np.uint8
+) -> np.ndarray:
+    """
+    Return a reusable output buffer with the given shape and dtype.
+
+    Args:
+        buffer: Previously allocated buffer, or None
+        shape: Required buffer shape
+        dtype: Required buffer dtype
+
+    Returns:
+        np.ndarray: The existing buffer if it still fits, otherwise a new one
+    """
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buffer
+
+
+def _poll_key() -> int:
+    """
+    Check for a key press without blocking.
+
+    Uses ``cv2.pollKey`` where available, falling back to ``cv2.waitKey(1)``
+    on OpenCV builds older than 4.5.
+
+    Returns:
+        int: Key code, or -1 if no key was pressed
+    """
+    poll_key = getattr(cv2, "pollKey", None)
+    if poll_key is not None:
+        return int(poll_key())
+    return cv2.waitKey(1)
+
+
+class _CaptureThread(threading.Thread):
+    """
+    Background thread that keeps only the most recent camera frame.
+
+    Frames are read in a tight loop and written into a single slot, so a slow
+    consumer always receives the newest frame instead of a stale buffered one.
+
+    Attributes:
+        cap: OpenCV video capture object to read from
+        stop_event: Event used to request the thread to stop
+    """
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        """
+        Initialize the capture thread.
+
+        Args:
+            cap: Opened video capture object to read from
+        """
+        super().__init__(name="CaptureThread", daemon=True)
+        self.cap = cap
+        self.stop_event = threading.Event()
+        self._latest: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def run(self) -> None:
+        """Read frames until stopped or the camera stops delivering frames."""
+        while not self.stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                logger.debug("Camera returned no frame, stopping capture thread")
+                break
+            with self._lock:
+                self._latest = frame
+
+    def get_latest(self) -> Optional[np.ndarray]:
+        """
+        Take the most recent frame, waiting until one is available.
+
+        Returns:
+            Optional[np.ndarray]: Newest captured frame, or None if capture
+            has stopped
+        """
+        while True:
+            with self._lock:
+                frame = self._latest
+                self._latest = None
+            if frame is not None:
+                return frame
+            if not self.is_alive():
+                return None
+            time.sleep(0.001)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop the thread and wait for it to finish.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread
+        """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
 class RockPaperScissors:
     """
     Main game class for Rock Paper Scissors hand gesture game.
@@ -36,11 +205,12 @@ class RockPaperScissors:
         cap: OpenCV video capture object
         game_state: Current state of the game
         countdown: Countdown timer value
-        last_countdown_time: Timestamp of last countdown update
+        last_countdown_time: Timestamp of last countdown update or round result
         computer_choice: Computer's gesture choice
         player_choice: Player's gesture choice
         result: Current game result
-        score: Dictionary containing player and computer scores
+        score: Player and computer scores
+        show_landmarks: Whether to draw the detected hand skeleton
     """
 
     def __init__(self) -> None:
@@ -52,9 +222,11 @@ class RockPaperScissors:
             ResourceInitializationError: If required resources cannot be initialized
         """
         logger.info("Initializing Rock Paper Scissors game")
-        self.gesture_detector = GestureDetector()
+        # Open the camera first so a camera failure leaves no MediaPipe graph
         self.cap = self._initialize_camera()
-        self.mp_draw = mp.solutions.drawing_utils
+        self.gesture_detector = GestureDetector()
+        self._capture: Optional[_CaptureThread] = None
+        self.show_landmarks: bool = False
 
         # Game state
         self.game_state: str = GameState.WAITING
@@ -63,9 +235,34 @@ class RockPaperScissors:
         self.computer_choice: Optional[Gesture] = None
         self.player_choice: Optional[Gesture] = None
         self.result: str = ""
-        self.score: Dict[str, int] = {"player": 0, "computer": 0}
+        self.score = Score()
+        self._last_infer: float = 0
+        self._gesture_votes: Dict[Gesture, int] = {}
+        self._last_shown: float = 0
+        self._flip_buf: Optional[np.ndarray] = None
+        self._small_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
+        self._update_layout(
+            int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or CAMERA_WIDTH,
+            int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or CAMERA_HEIGHT,
+        )
         logger.debug("Game initialized with default state")
 
+    def _update_layout(self, width: int, height: int) -> None:
+        """
+        Cache interface text positions for the given frame size.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+        """
+        self._w, self._h = width, height
+        self._pos_start = (width // 4, 50)
+        self._pos_count = (width // 2, height // 2)
+        self._pos_result = (width // 4, height // 2)
+        self._pos_score = (10, height - 20)
+        self._pos_quit = (10, height - 50)
+
     def _initialize_camera(self) -> cv2.VideoCapture:
         """
         Initialize the camera for video capture.
@@ -77,13 +274,44 @@ class RockPaperScissors:
             CameraError: If camera cannot be initialized
         """
         logger.info("Initializing camera")
-        cap = cv2.VideoCapture(0)
+        if sys.platform.startswith("linux"):
+            cap = cv2.VideoCapture(CAMERA_INDEX, cv2.CAP_V4L2)
+        else:
+            cap = cv2.VideoCapture(CAMERA_INDEX)
         if not cap.isOpened():
             logger.error("Failed to initialize camera")
             raise CameraError("Failed to initialize camera")
+        self._configure_camera(cap)
         logger.debug("Camera initialized successfully")
         return cap
 
+    def _configure_camera(self, cap: cv2.VideoCapture) -> None:
+        """
+        Request low-latency capture settings from the camera driver.
+
+        Keeping a single buffered frame stops ``cap.read()`` from returning
+        stale frames, and asking for MJPG at a fixed resolution prevents the
+        driver from negotiating a larger YUYV stream. Not every backend honors
+        these properties, so failures are logged and otherwise ignored.
+
+        Args:
+            cap: Opened video capture object to configure
+        """
+        properties = (
+            ("CAP_PROP_BUFFERSIZE", cv2.CAP_PROP_BUFFERSIZE, CAMERA_BUFFER_SIZE),
+            ("CAP_PROP_FOURCC", cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*"MJPG")),
+            ("CAP_PROP_FRAME_WIDTH", cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH),
+            ("CAP_PROP_FRAME_HEIGHT", cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT),
+        )
+        for name, prop, value in properties:
+            try:
+                applied = cap.set(prop, value)
+            except cv2.error as e:
+                logger.debug("Camera backend rejected %s: %s", name, e)
+                continue
+            if not applied:
+                logger.debug("Camera backend ignored %s=%s", name, value)
+
     def get_computer_choice(self) -> Gesture:
         """
         Generate random computer choice.
@@ -91,8 +319,8 @@ class RockPaperScissors:
         Returns:
             Gesture: Randomly selected gesture
         """
-        choice = random.choice(list(Gesture))
-        logger.debug(f"Computer chose {choice.name}")
+        choice = _GESTURES[_RNG.randrange(len(_GESTURES))]
+        logger.debug("Computer chose %s", choice.name)
         return choice
 
     def determine_winner(self) -> str:
@@ -102,29 +330,125 @@ class RockPaperScissors:
         Returns:
             str: Result message indicating the winner
         """
+        assert self.player_choice is not None, "player_choice is not set"
+        assert self.computer_choice is not None, "computer_choice is not set"
+
         if self.player_choice == self.computer_choice:
             logger.info("Game resulted in a tie")
             return "Tie!"
 
-        winning_combinations = {
-            (Gesture.ROCK, Gesture.SCISSORS),
-            (Gesture.PAPER, Gesture.ROCK),
-            (Gesture.SCISSORS, Gesture.PAPER),
-        }
-
-        if (self.player_choice, self.computer_choice) in winning_combinations:
-            self.score["player"] += 1
+        if _PLAYER_WINS[self.player_choice.value, self.computer_choice.value]:
+            self.score.player += 1
             logger.info(
-                f"Player wins! New score - Player: {self.score['player']}, Computer: {self.score['computer']}"
+                "Player wins! New score - Player: %d, Computer: %d",
+                self.score.player,
+                self.score.computer,
             )
             return "You Win!"
         else:
-            self.score["computer"] += 1
+            self.score.computer += 1
             logger.info(
-                f"Computer wins! New score - Player: {self.score['player']}, Computer: {self.score['computer']}"
+                "Computer wins! New score - Player: %d, Computer: %d",
+                self.score.player,
+                self.score.computer,
             )
             return "Computer Wins!"
 
+    def _confirm_gesture(self, gesture: Optional[Gesture]) -> Optional[Gesture]:
+        """
+        Record a detection and check whether the gesture is confirmed.
+
+        A gesture is confirmed once it has been detected on
+        ``GESTURE_CONFIRM_FRAMES`` consecutive inferences, which filters out
+        transient misclassifications while the hand is moving.
+
+        Args:
+            gesture: Gesture detected on the current frame, or None
+
+        Returns:
+            Optional[Gesture]: The gesture once confirmed, otherwise None
+        """
+        if gesture is None:
+            self._gesture_votes = {}
+            return None
+        votes = self._gesture_votes.get(gesture, 0) + 1
+        if votes >= GESTURE_CONFIRM_FRAMES:
+            self._gesture_votes = {}
+            return gesture
+        self._gesture_votes = {gesture: votes}
+        return None
+
+    def _should_run_inference(self, current_time: float) -> bool:
+        """
+        Check whether hand landmarks are needed for the current game state.
+
+        Inference runs on every frame while waiting for a hand or reading the
+        player's gesture, is throttled during the countdown, and is skipped
+        while a result is shown.
+
+        Args:
+            current_time: Monotonic timestamp of the current frame
+
+        Returns:
+            bool: True if the frame should be passed to MediaPipe
+        """
+        if self.game_state in (GameState.WAITING, GameState.PLAYING):
+            return True
+        if self.game_state == GameState.COUNTDOWN:
+            return current_time - self._last_infer >= COUNTDOWN_INFERENCE_INTERVAL
+        return False
+
+    def _prepare_inference_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Downscale a BGR frame and convert it to RGB for hand inference.
+
+        MediaPipe resizes its input to a small square internally, so shrinking
+        the frame first only cuts the bytes moved through color conversion.
+        Landmarks are normalized, so they still map onto the full-size frame.
+
+        Args:
+            frame: Full-size BGR video frame
+
+        Returns:
+            np.ndarray: Downscaled, read-only RGB frame backed by a reused buffer
+        """
+        h, w = frame.shape[:2]
+        if w > INFERENCE_WIDTH:
+            small_shape = (max(1, h * INFERENCE_WIDTH // w), INFERENCE_WIDTH, 3)
+            self._small_buf = _ensure_buffer(self._small_buf, small_shape)
+            frame = cv2.resize(
+                frame,
+                (small_shape[1], small_shape[0]),
+                dst=self._small_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+        self._rgb_buf = _ensure_buffer(self._rgb_buf, frame.shape)
+        self._rgb_buf.flags.writeable = True
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # Read-only input lets MediaPipe use the buffer without copying it
+        rgb_frame.flags.writeable = False
+        return rgb_frame
+
+    def _draw_landmarks(
+        self, frame: np.ndarray, hand_landmarks: mp.solutions.hands.HandLandmark
+    ) -> None:
+        """
+        Draw the hand skeleton onto a frame with a single polylines call.
+
+        Args:
+            frame: Video frame to draw on
+            hand_landmarks: MediaPipe hand landmarks with normalized coordinates
+        """
+        h, w = frame.shape[:2]
+        points = hand_landmarks.landmark
+        pts = np.fromiter(
+            (v for lm in points for v in (lm.x * w, lm.y * h)),
+            dtype=np.float32,
+            count=2 * len(points),
+        ).reshape(-1, 2)
+        edges = pts.astype(np.int32)[_CONN_INDEX]
+        cv2.polylines(frame, list(edges), False, (0, 255, 0), 2)
+
     def display_interface(self, frame: np.ndarray) -> None:
         """
         Display game interface on frame.
@@ -132,13 +456,14 @@ class RockPaperScissors:
         Args:
             frame: Video frame to display interface on
         """
-        h, w, _ = frame.shape
+        if frame.shape[1] != self._w or frame.shape[0] != self._h:
+            self._update_layout(frame.shape[1], frame.shape[0])
 
         if self.game_state == GameState.WAITING:
             cv2.putText(
                 frame,
                 "Show hand to start!",
-                (int(w / 4), 50),
+                self._pos_start,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 1,
                 (0, 255, 0),
@@ -148,7 +473,7 @@ class RockPaperScissors:
             cv2.putText(
                 frame,
                 str(self.countdown),
-                (int(w / 2), int(h / 2)),
+                self._pos_count,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 4,
                 (255, 0, 0),
@@ -178,7 +503,7 @@ class RockPaperScissors:
             cv2.putText(
                 frame,
                 self.result,
-                (int(w / 4), int(h / 2)),
+                self._pos_result,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 2,
                 (255, 0, 0),
@@ -186,114 +511,152 @@ class RockPaperScissors:
             )
 
         # Always display score
-        score_text = (
-            f"Score - You: {self.score['player']} Computer: {self.score['computer']}"
-        )
+        score_text = f"Score - You: {self.score.player} Computer: {self.score.computer}"
         cv2.putText(
             frame,
             score_text,
-            (10, h - 20),
+            self._pos_score,
             cv2.FONT_HERSHEY_SIMPLEX,
             0.7,
             (255, 255, 255),
             2,
         )
 
+    def _update_game_state(
+        self, multi_hand_landmarks: Optional[List[Any]], now: float
+    ) -> None:
+        """
+        Advance the game state machine for the current frame.
+
+        Args:
+            multi_hand_landmarks: Hand landmarks detected on this frame, or None
+            now: Monotonic timestamp of the current frame
+        """
+        if multi_hand_landmarks:
+            for hand_landmarks in multi_hand_landmarks:
+                if self.game_state == GameState.WAITING:
+                    logger.debug("Hand detected, starting countdown")
+                    self.game_state = GameState.COUNTDOWN
+                    self.last_countdown_time = now
+
+                elif self.game_state == GameState.COUNTDOWN:
+                    if now - self.last_countdown_time >= 1:
+                        self.countdown -= 1
+                        logger.debug("Countdown: %d", self.countdown)
+                        self.last_countdown_time = now
+                        if self.countdown <= 0:
+                            logger.info("Countdown finished, starting game")
+                            self.game_state = GameState.PLAYING
+                            self.computer_choice = self.get_computer_choice()
+
+                elif self.game_state == GameState.PLAYING:
+                    try:
+                        gesture = self.gesture_detector.detect_gesture(hand_landmarks)
+                        confirmed = self._confirm_gesture(gesture)
+                        if confirmed is not None:
+                            logger.info("Player chose %s", confirmed.name)
+                            self.player_choice = confirmed
+                            self.result = self.determine_winner()
+                            self.game_state = GameState.RESULT
+                            self.last_countdown_time = now
+                            self.countdown = 3
+                    except GestureDetectionError as e:
+                        logger.error("Gesture detection error: %s", e)
+
+        elif self.game_state == GameState.PLAYING:
+            # Inference runs on every PLAYING frame, so no landmarks means
+            # the hand was lost and the gesture streak is broken
+            self._gesture_votes = {}
+
+        elif self.game_state == GameState.RESULT:
+            if now - self.last_countdown_time >= 2:
+                logger.debug("Resetting game state to WAITING")
+                self.game_state = GameState.WAITING
+                self.countdown = 3
+
     def run(self) -> None:
         """
         Main game loop.
 
+        Resources are not released here; use the game as a context manager
+        or call cleanup() afterwards.
+
         Raises:
             CameraError: If there are issues with camera access
             GestureDetectionError: If gesture detection fails
         """
         logger.info("Starting game loop")
+        self._capture = _CaptureThread(self.cap)
+        self._capture.start()
         try:
             while True:
-                ret, frame = self.cap.read()
-                if not ret:
+                frame = self._capture.get_latest()
+                if frame is None:
                     logger.error("Failed to capture video frame")
                     raise CameraError("Failed to capture video frame")
-
-                frame = cv2.flip(frame, 1)
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-                results = self.gesture_detector.hands.process(rgb_frame)
-
-                if results.multi_hand_landmarks:
-                    for hand_landmarks in results.multi_hand_landmarks:
-                        self.mp_draw.draw_landmarks(
-                            frame,
-                            hand_landmarks,
-                            self.gesture_detector.mp_hands.HAND_CONNECTIONS,
-                        )
-
-                        if self.game_state == GameState.WAITING:
-                            logger.debug("Hand detected, starting countdown")
-                            self.game_state = GameState.COUNTDOWN
-                            self.last_countdown_time = time.time()
-
-                        elif self.game_state == GameState.COUNTDOWN:
-                            current_time = time.time()
-                            if current_time - self.last_countdown_time >= 1:
-                                self.countdown -= 1
-                                logger.debug(f"Countdown: {self.countdown}")
-                                self.last_countdown_time = current_time
-                                if self.countdown <= 0:
-                                    logger.info("Countdown finished, starting game")
-                                    self.game_state = GameState.PLAYING
-                                    self.computer_choice = self.get_computer_choice()
-
-                        elif self.game_state == GameState.PLAYING:
-                            try:
-                                gesture = self.gesture_detector.detect_gesture(
-                                    hand_landmarks
-                                )
-                                if gesture:
-                                    logger.info(f"Player chose {gesture.name}")
-                                    self.player_choice = gesture
-                                    self.result = self.determine_winner()
-                                    self.game_state = GameState.RESULT
-                                    self.countdown = 3
-                            except GestureDetectionError as e:
-                                logger.error(f"Gesture detection error: {e}")
-
-                elif self.game_state == GameState.RESULT:
-                    current_time = time.time()
-                    if current_time - self.last_countdown_time >= 2:
-                        logger.debug("Resetting game state to WAITING")
-                        self.game_state = GameState.WAITING
-                        self.countdown = 3
-
-                self.display_interface(frame)
-
-                cv2.putText(
-                    frame,
-                    "Press 'q' or 'ESC' to quit",
-                    (10, frame.shape[0] - 50),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.7,
-                    (255, 255, 255),
-                    2,
-                )
-
-                cv2.imshow("Rock Paper Scissors", frame)
-
-                key = cv2.waitKey(1) & 0xFF
+                now = time.monotonic()
+
+                self._flip_buf = _ensure_buffer(self._flip_buf, frame.shape)
+                frame = cv2.flip(frame, 1, dst=self._flip_buf)
+
+                multi_hand_landmarks = None
+                if self._should_run_inference(now):
+                    rgb_frame = self._prepare_inference_frame(frame)
+                    results = self.gesture_detector.hands.process(rgb_frame)
+                    multi_hand_landmarks = results.multi_hand_landmarks
+                    self._last_infer = now
+
+                self._update_game_state(multi_hand_landmarks, now)
+
+                # Frames arrive at about the camera's own 30 fps, so allow some
+                # slack or arrival jitter would skip every other frame
+                if now - self._last_shown >= DISPLAY_INTERVAL * 0.9:
+                    if multi_hand_landmarks and self.show_landmarks:
+                        for hand_landmarks in multi_hand_landmarks:
+                            self._draw_landmarks(frame, hand_landmarks)
+
+                    self.display_interface(frame)
+
+                    cv2.putText(
+                        frame,
+                        "Press 'q' or 'ESC' to quit",
+                        self._pos_quit,
+                        cv2.FONT_HERSHEY_SIMPLEX,
+                        0.7,
+                        (255, 255, 255),
+                        2,
+                    )
+
+                    cv2.imshow("Rock Paper Scissors", frame)
+                    self._last_shown = now
+
+                # Pumps window events on every iteration, drawn or not
+                key = _poll_key() & 0xFF
                 if key == ord("q") or key == 27:  # 27 is ESC key
                     logger.info("Game terminated by user")
                     break
 
         except Exception as e:
-            logger.error(f"Game error: {str(e)}")
+            logger.error("Game error: %s", e)
             raise CameraError(f"Game error: {str(e)}")
 
-        finally:
-            self.cleanup()
-
     def cleanup(self) -> None:
         """Clean up resources."""
         logger.info("Cleaning up resources")
+        capture = getattr(self, "_capture", None)
+        if capture is not None:
+            capture.stop()
+            self._capture = None
         if hasattr(self, "cap"):
             self.cap.release()
+        if hasattr(self, "gesture_detector"):
+            self.gesture_detector.close()
         cv2.destroyAllWindows()
+
+    def __enter__(self) -> "RockPaperScissors":
+        """Return the game for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release resources when leaving a ``with`` block."""
+        self.cleanup()
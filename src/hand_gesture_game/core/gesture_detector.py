@@ -1,7 +1,7 @@
 """Module for detecting and classifying hand gestures using MediaPipe."""
 
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 
 import mediapipe as mp
 import numpy as np
@@ -17,6 +17,41 @@ class Gesture(Enum):
     SCISSORS = 2
 
 
+# Landmark indices ordered thumb, index, middle, ring, pinky
+FINGER_TIP_IDS: Tuple[int, ...] = (4, 8, 12, 16, 20)
+FINGER_BASE_IDS: Tuple[int, ...] = (2, 5, 9, 13, 17)
+_TIP_INDEX = np.array(FINGER_TIP_IDS, dtype=np.intp)
+_BASE_INDEX = np.array(FINGER_BASE_IDS, dtype=np.intp)
+
+
+def _build_gesture_table() -> Tuple[Optional[Gesture], ...]:
+    """
+    Build a lookup table mapping each 5-bit finger pattern to a gesture.
+
+    Bit ``i`` of the index is set when finger ``i`` (thumb=0 ... pinky=4)
+    is extended.
+
+    Returns:
+        Tuple[Optional[Gesture], ...]: 32 entries, None for unrecognized patterns
+    """
+    table: List[Optional[Gesture]] = []
+    for pattern in range(32):
+        extended = [bool(pattern >> i & 1) for i in range(5)]
+        extended_count = sum(extended)
+        if extended_count <= 1:
+            table.append(Gesture.ROCK)
+        elif extended_count == 2 and extended[1] and extended[2]:
+            table.append(Gesture.SCISSORS)
+        elif extended_count >= 4:
+            table.append(Gesture.PAPER)
+        else:
+            table.append(None)
+    return tuple(table)
+
+
+_GESTURE_TABLE: Tuple[Optional[Gesture], ...] = _build_gesture_table()
+
+
 class GestureDetector:
     """
     A class for detecting and classifying hand gestures using MediaPipe.
@@ -26,7 +61,7 @@ class GestureDetector:
 
     Attributes:
         mp_hands: MediaPipe Hands solution
-        hands: Configured MediaPipe Hands model instance
+        hands: Configured MediaPipe Hands model instance, None once closed
         min_detection_confidence: Minimum confidence for hand detection
         min_tracking_confidence: Minimum confidence for hand tracking
     """
@@ -61,13 +96,14 @@ class GestureDetector:
         self.min_tracking_confidence = min_tracking_confidence
 
     def detect_gesture(
-        self, landmarks: mp.solutions.hands.HandLandmark
+        self, landmarks: Union[mp.solutions.hands.HandLandmark, np.ndarray]
     ) -> Optional[Gesture]:
         """
         Detect the gesture based on hand landmarks.
 
         Args:
-            landmarks: MediaPipe hand landmarks
+            landmarks: MediaPipe hand landmarks, or a (21, 2) or (21, 3) array
+                of landmark coordinates indexed by landmark id
 
         Returns:
             Optional[Gesture]: Detected gesture or None if no gesture is recognized
@@ -76,73 +112,92 @@ class GestureDetector:
             GestureDetectionError: If gesture detection fails
         """
         try:
-            # Get finger landmarks
-            finger_tips = [
-                landmarks.landmark[4],  # thumb
-                landmarks.landmark[8],  # index
-                landmarks.landmark[12],  # middle
-                landmarks.landmark[16],  # ring
-                landmarks.landmark[20],  # pinky
-            ]
-            finger_bases = [
-                landmarks.landmark[2],  # thumb base
-                landmarks.landmark[5],  # index base
-                landmarks.landmark[9],  # middle base
-                landmarks.landmark[13],  # ring base
-                landmarks.landmark[17],  # pinky base
-            ]
-
-            fingers_extended = self._check_fingers_extended(finger_tips, finger_bases)
-            return self._classify_gesture(fingers_extended)
+            if not isinstance(landmarks, np.ndarray):
+                fingers_extended = self._check_fingers_extended(landmarks)
+                return self._classify_gesture(fingers_extended)
+
+            finger_tips = landmarks[_TIP_INDEX, :2].astype(np.float32)
+            finger_bases = landmarks[_BASE_INDEX, :2].astype(np.float32)
+
+            return self._classify_gesture(
+                self._check_array_fingers_extended(finger_tips, finger_bases)
+            )
 
         except Exception as e:
             raise GestureDetectionError(f"Failed to detect gesture: {str(e)}")
 
     def _check_fingers_extended(
-        self,
-        finger_tips: List[mp.solutions.hands.HandLandmark],
-        finger_bases: List[mp.solutions.hands.HandLandmark],
+        self, landmarks: mp.solutions.hands.HandLandmark
     ) -> List[bool]:
         """
         Check which fingers are extended based on their landmarks.
 
         Args:
-            finger_tips: List of finger tip landmarks
-            finger_bases: List of finger base landmarks
+            landmarks: MediaPipe hand landmarks
 
         Returns:
             List[bool]: List indicating which fingers are extended
         """
-        fingers_extended = []
-        for i, (tip, base) in enumerate(zip(finger_tips, finger_bases)):
-            if i == 0:  # Thumb
-                fingers_extended.append(tip.x < base.x)
-            else:  # Other fingers
-                fingers_extended.append(tip.y < base.y)
+        lm = landmarks.landmark
+        # Thumb extends sideways, other fingers extend upwards
+        return [
+            lm[4].x < lm[2].x,  # thumb
+            lm[8].y < lm[5].y,  # index
+            lm[12].y < lm[9].y,  # middle
+            lm[16].y < lm[13].y,  # ring
+            lm[20].y < lm[17].y,  # pinky
+        ]
+
+    def _check_array_fingers_extended(
+        self, finger_tips: np.ndarray, finger_bases: np.ndarray
+    ) -> np.ndarray:
+        """
+        Check which fingers are extended based on landmark coordinate arrays.
+
+        Args:
+            finger_tips: (5, 2) array of finger tip x/y coordinates
+            finger_bases: (5, 2) array of finger base x/y coordinates
+
+        Returns:
+            np.ndarray: Boolean array indicating which fingers are extended
+        """
+        fingers_extended = np.empty(5, dtype=bool)
+        fingers_extended[0] = finger_tips[0, 0] < finger_bases[0, 0]
+        fingers_extended[1:] = finger_tips[1:, 1] < finger_bases[1:, 1]
         return fingers_extended
 
-    def _classify_gesture(self, fingers_extended: List[bool]) -> Optional[Gesture]:
+    def _classify_gesture(
+        self, fingers_extended: Union[Sequence[bool], np.ndarray]
+    ) -> Optional[Gesture]:
         """
         Classify the gesture based on extended fingers.
 
         Args:
-            fingers_extended: List indicating which fingers are extended
+            fingers_extended: Flags indicating which fingers are extended
 
         Returns:
             Optional[Gesture]: Classified gesture or None if no gesture is recognized
         """
-        extended_count = sum(fingers_extended)
-
-        if extended_count <= 1:
-            return Gesture.ROCK
-        elif extended_count == 2 and fingers_extended[1] and fingers_extended[2]:
-            return Gesture.SCISSORS
-        elif extended_count >= 4:
-            return Gesture.PAPER
-
-        return None
-
-    def __del__(self) -> None:
-        """Clean up MediaPipe resources."""
-        if hasattr(self, "hands"):
-            self.hands.close()
+        pattern = (
+            int(fingers_extended[0])
+            | int(fingers_extended[1]) << 1
+            | int(fingers_extended[2]) << 2
+            | int(fingers_extended[3]) << 3
+            | int(fingers_extended[4]) << 4
+        )
+        return _GESTURE_TABLE[pattern]
+
+    def close(self) -> None:
+        """Clean up MediaPipe resources. Safe to call more than once."""
+        hands = getattr(self, "hands", None)
+        if hands is not None:
+            hands.close()
+            self.hands = None
+
+    def __enter__(self) -> "GestureDetector":
+        """Return the detector for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the detector when leaving a ``with`` block."""
+        self.close()
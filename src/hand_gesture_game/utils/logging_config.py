@@ -1,19 +1,30 @@
 """Logging configuration for the Hand Gesture Game."""
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+# Background listener that writes queued records to the log file, and the
+# handler that feeds it from the application logger
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
 
 def setup_logging(log_file: Optional[str] = None, level: int = logging.INFO) -> None:
     """
     Configure logging for the application.
 
     Args:
-        log_file: Optional path to log file. If None, logs only to console
+        log_file: Optional path to log file. If None, logs only to console.
+            File records are queued and written by a background thread; call
+            shutdown_logging() before exit to flush them
         level: Logging level (default: INFO)
     """
+    global _listener, _queue_handler
+
     # Create formatter
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -29,13 +40,33 @@ def setup_logging(log_file: Optional[str] = None, level: int = logging.INFO) ->
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
-    # File handler (if log_file specified)
+    # File handler (if log_file specified), written from a background thread
     if log_file:
+        shutdown_logging()
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=5 * 1024 * 1024, backupCount=3, delay=True
+        )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        _listener = QueueListener(log_queue, file_handler)
+        _listener.start()
+        _queue_handler = QueueHandler(log_queue)
+        root_logger.addHandler(_queue_handler)
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records to the log file and stop the listener thread."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger("hand_gesture_game").removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,12 +1,20 @@
 """Unit tests for the RockPaperScissors game class."""
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import cv2
 import numpy as np
 
-from hand_gesture_game.core.game import GameState, RockPaperScissors
+from hand_gesture_game.core.game import (
+    GameState,
+    RockPaperScissors,
+    Score,
+    _CaptureThread,
+    _ensure_buffer,
+    _poll_key,
+)
 from hand_gesture_game.core.gesture_detector import Gesture
 from hand_gesture_game.exceptions.game_exceptions import CameraError
 
@@ -29,7 +37,7 @@ class TestRockPaperScissors(unittest.TestCase):
         """Test initial game state."""
         self.assertEqual(self.game.game_state, GameState.WAITING)
         self.assertEqual(self.game.countdown, 3)
-        self.assertEqual(self.game.score, {"player": 0, "computer": 0})
+        self.assertEqual(self.game.score, Score())
         self.assertIsNone(self.game.computer_choice)
         self.assertIsNone(self.game.player_choice)
         self.assertEqual(self.game.result, "")
@@ -38,8 +46,38 @@ class TestRockPaperScissors(unittest.TestCase):
     def test_camera_initialization_error(self, mock_video_capture):
         """Test camera initialization error handling."""
         mock_video_capture.return_value.isOpened.return_value = False
-        with self.assertRaises(CameraError):
-            RockPaperScissors()
+        with patch("hand_gesture_game.core.game.GestureDetector") as mock_detector:
+            with self.assertRaises(CameraError):
+                RockPaperScissors()
+        mock_detector.assert_not_called()
+
+    @patch("cv2.VideoCapture")
+    def test_camera_configuration(self, mock_video_capture):
+        """Test camera is configured for low-latency capture."""
+        mock_video_capture.return_value.isOpened.return_value = True
+        game = RockPaperScissors()
+        self.addCleanup(game.cleanup)
+        game.cap.set.assert_any_call(cv2.CAP_PROP_BUFFERSIZE, 1)
+        game.cap.set.assert_any_call(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        game.cap.set.assert_any_call(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+
+    @patch("cv2.VideoCapture")
+    def test_camera_configuration_unsupported(self, mock_video_capture):
+        """Test unsupported camera properties do not abort initialization."""
+        mock_video_capture.return_value.isOpened.return_value = True
+        mock_video_capture.return_value.set.return_value = False
+        game = RockPaperScissors()
+        self.addCleanup(game.cleanup)
+        self.assertIs(game.cap, mock_video_capture.return_value)
+
+    @patch("cv2.VideoCapture")
+    def test_context_manager_cleanup(self, mock_video_capture):
+        """Test leaving a with block releases the camera and detector."""
+        mock_video_capture.return_value.isOpened.return_value = True
+        with RockPaperScissors() as game:
+            pass
+        game.cap.release.assert_called_once()
+        self.assertIsNone(game.gesture_detector.hands)
 
     def test_get_computer_choice(self):
         """Test computer choice generation."""
@@ -52,8 +90,8 @@ class TestRockPaperScissors(unittest.TestCase):
         self.game.computer_choice = Gesture.ROCK
         result = self.game.determine_winner()
         self.assertEqual(result, "Tie!")
-        self.assertEqual(self.game.score["player"], 0)
-        self.assertEqual(self.game.score["computer"], 0)
+        self.assertEqual(self.game.score.player, 0)
+        self.assertEqual(self.game.score.computer, 0)
 
     def test_determine_winner_player_wins(self):
         """Test winner determination when player wins."""
@@ -65,13 +103,13 @@ class TestRockPaperScissors(unittest.TestCase):
 
         for player_choice, computer_choice in test_cases:
             with self.subTest(player=player_choice, computer=computer_choice):
-                self.game.score = {"player": 0, "computer": 0}
+                self.game.score = Score()
                 self.game.player_choice = player_choice
                 self.game.computer_choice = computer_choice
                 result = self.game.determine_winner()
                 self.assertEqual(result, "You Win!")
-                self.assertEqual(self.game.score["player"], 1)
-                self.assertEqual(self.game.score["computer"], 0)
+                self.assertEqual(self.game.score.player, 1)
+                self.assertEqual(self.game.score.computer, 0)
 
     def test_determine_winner_computer_wins(self):
         """Test winner determination when computer wins."""
@@ -83,13 +121,131 @@ class TestRockPaperScissors(unittest.TestCase):
 
         for player_choice, computer_choice in test_cases:
             with self.subTest(player=player_choice, computer=computer_choice):
-                self.game.score = {"player": 0, "computer": 0}
+                self.game.score = Score()
                 self.game.player_choice = player_choice
                 self.game.computer_choice = computer_choice
                 result = self.game.determine_winner()
                 self.assertEqual(result, "Computer Wins!")
-                self.assertEqual(self.game.score["player"], 0)
-                self.assertEqual(self.game.score["computer"], 1)
+                self.assertEqual(self.game.score.player, 0)
+                self.assertEqual(self.game.score.computer, 1)
+
+    def test_confirm_gesture(self):
+        """Test a gesture is confirmed only after consecutive detections."""
+        self.assertIsNone(self.game._confirm_gesture(Gesture.ROCK))
+        self.assertIsNone(self.game._confirm_gesture(Gesture.ROCK))
+        self.assertIsNone(self.game._confirm_gesture(Gesture.PAPER))
+        self.assertIsNone(self.game._confirm_gesture(Gesture.PAPER))
+        self.assertIsNone(self.game._confirm_gesture(None))
+        self.assertIsNone(self.game._confirm_gesture(Gesture.PAPER))
+        self.assertIsNone(self.game._confirm_gesture(Gesture.PAPER))
+        self.assertIs(self.game._confirm_gesture(Gesture.PAPER), Gesture.PAPER)
+        self.assertEqual(self.game._gesture_votes, {})
+
+    def test_should_run_inference(self):
+        """Test inference is gated on the game state."""
+        for state in (GameState.WAITING, GameState.PLAYING):
+            with self.subTest(state=state):
+                self.game.game_state = state
+                self.assertTrue(self.game._should_run_inference(0.0))
+
+        self.game.game_state = GameState.RESULT
+        self.assertFalse(self.game._should_run_inference(100.0))
+
+        self.game.game_state = GameState.COUNTDOWN
+        self.game._last_infer = 10.0
+        self.assertFalse(self.game._should_run_inference(10.1))
+        self.assertTrue(self.game._should_run_inference(10.25))
+
+    def test_result_is_shown_before_reset(self):
+        """Test the result stays up for two seconds after the round ends."""
+        hand = SimpleNamespace(landmark=[])
+        self.game.game_state = GameState.PLAYING
+        self.game.computer_choice = Gesture.SCISSORS
+        self.game.last_countdown_time = 50.0
+        self.game.gesture_detector.detect_gesture = Mock(return_value=Gesture.ROCK)
+
+        for now in (100.0, 100.1, 100.2):
+            self.game._update_game_state([hand], now)
+        self.assertEqual(self.game.game_state, GameState.RESULT)
+        self.assertEqual(self.game.result, "You Win!")
+
+        self.game._update_game_state(None, 101.5)
+        self.assertEqual(self.game.game_state, GameState.RESULT)
+
+        self.game._update_game_state(None, 102.2)
+        self.assertEqual(self.game.game_state, GameState.WAITING)
+
+    def test_lost_hand_resets_gesture_votes(self):
+        """Test a frame without a hand breaks the run of matching gestures."""
+        hand = SimpleNamespace(landmark=[])
+        self.game.game_state = GameState.PLAYING
+        self.game.computer_choice = Gesture.SCISSORS
+        self.game.gesture_detector.detect_gesture = Mock(return_value=Gesture.ROCK)
+
+        self.game._update_game_state([hand], 100.0)
+        self.game._update_game_state(None, 100.1)
+        self.game._update_game_state([hand], 100.2)
+        self.game._update_game_state([hand], 100.3)
+        self.assertEqual(self.game.game_state, GameState.PLAYING)
+
+        self.game._update_game_state([hand], 100.4)
+        self.assertEqual(self.game.game_state, GameState.RESULT)
+
+    def test_run_displays_every_camera_frame(self):
+        """Test frames arriving at 30 fps with jitter are all displayed."""
+        rng = np.random.default_rng(0)
+        timestamps = [i / 30 + rng.uniform(0.0005, 0.002) for i in range(1, 61)]
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        hands = Mock()
+        hands.process.return_value = SimpleNamespace(multi_hand_landmarks=None)
+        self.game.gesture_detector.hands = hands
+        keys = [-1] * (len(timestamps) - 1) + [ord("q")]
+
+        with patch("hand_gesture_game.core.game._CaptureThread") as mock_thread, patch(
+            "hand_gesture_game.core.game.time.monotonic", side_effect=timestamps
+        ), patch("hand_gesture_game.core.game._poll_key", side_effect=keys), patch(
+            "cv2.imshow"
+        ) as mock_imshow:
+            mock_thread.return_value.get_latest.return_value = frame
+            self.game.run()
+
+        self.assertEqual(mock_imshow.call_count, len(timestamps))
+        # Cleanup is left to the context manager
+        self.game.cap.release.assert_not_called()
+
+    def test_prepare_inference_frame(self):
+        """Test frames are downscaled and converted to RGB for inference."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[..., 0] = 255  # blue in BGR
+
+        rgb_frame = self.game._prepare_inference_frame(frame)
+        self.assertEqual(rgb_frame.shape, (192, 256, 3))
+        self.assertTrue((rgb_frame[..., 2] == 255).all())
+        self.assertTrue((rgb_frame[..., 0] == 0).all())
+        self.assertFalse(rgb_frame.flags.writeable)
+        self.assertIs(self.game._prepare_inference_frame(frame), rgb_frame)
+
+    def test_draw_landmarks(self):
+        """Test the hand skeleton is drawn from normalized landmarks."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        hand_landmarks = SimpleNamespace(
+            landmark=[
+                SimpleNamespace(x=0.3 + 0.02 * i, y=0.8 - 0.03 * i) for i in range(21)
+            ]
+        )
+        self.assertFalse(self.game.show_landmarks)
+        self.game._draw_landmarks(frame, hand_landmarks)
+        self.assertTrue(frame[..., 1].any())
+
+    def test_layout_follows_frame_size(self):
+        """Test cached text positions are updated when the frame size changes."""
+        self.game.display_interface(np.zeros((480, 640, 3), dtype=np.uint8))
+        self.assertEqual(self.game._pos_count, (320, 240))
+        self.assertEqual(self.game._pos_score, (10, 460))
+
+        self.game.display_interface(np.zeros((720, 1280, 3), dtype=np.uint8))
+        self.assertEqual(self.game._pos_count, (640, 360))
+        self.assertEqual(self.game._pos_quit, (10, 670))
 
     def test_display_interface(self):
         """Test game interface display."""
@@ -115,5 +271,68 @@ class TestRockPaperScissors(unittest.TestCase):
         # In a real application, we might want to test the actual frame contents
 
 
+class TestEnsureBuffer(unittest.TestCase):
+    """Test cases for the _ensure_buffer helper."""
+
+    def test_reuses_matching_buffer(self):
+        """Test a buffer matching the frame is returned unchanged."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        buffer = np.empty_like(frame)
+        self.assertIs(_ensure_buffer(buffer, frame.shape), buffer)
+
+    def test_reallocates_on_shape_change(self):
+        """Test a new buffer is allocated when the frame shape changes."""
+        buffer = np.empty((240, 320, 3), dtype=np.uint8)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        new_buffer = _ensure_buffer(buffer, frame.shape)
+        self.assertIsNot(new_buffer, buffer)
+        self.assertEqual(new_buffer.shape, frame.shape)
+        self.assertEqual(_ensure_buffer(None, frame.shape).shape, frame.shape)
+
+
+class TestPollKey(unittest.TestCase):
+    """Test cases for the _poll_key helper."""
+
+    @patch("cv2.pollKey", create=True, return_value=113)
+    def test_uses_poll_key(self, mock_poll_key):
+        """Test pollKey is used when available."""
+        self.assertEqual(_poll_key(), 113)
+        mock_poll_key.assert_called_once_with()
+
+    @patch("cv2.waitKey", return_value=27)
+    def test_falls_back_to_wait_key(self, mock_wait_key):
+        """Test waitKey(1) is used on OpenCV builds without pollKey."""
+        with patch.object(cv2, "pollKey", None, create=True):
+            self.assertEqual(_poll_key(), 27)
+        mock_wait_key.assert_called_once_with(1)
+
+
+class TestCaptureThread(unittest.TestCase):
+    """Test cases for the _CaptureThread class."""
+
+    def test_get_latest_returns_newest_frame(self):
+        """Test the consumer receives the last frame read before capture stopped."""
+        frames = [np.full((2, 2, 3), i, dtype=np.uint8) for i in range(3)]
+        cap = Mock()
+        cap.read.side_effect = [(True, f) for f in frames] + [(False, None)]
+        thread = _CaptureThread(cap)
+        thread.start()
+        thread.join(1.0)
+
+        latest = thread.get_latest()
+        self.assertIsNotNone(latest)
+        self.assertEqual(latest[0, 0, 0], 2)
+        self.assertIsNone(thread.get_latest())
+
+    def test_stop(self):
+        """Test stopping the thread ends the read loop."""
+        cap = Mock()
+        cap.read.return_value = (True, np.zeros((2, 2, 3), dtype=np.uint8))
+        thread = _CaptureThread(cap)
+        thread.start()
+        thread.stop()
+        self.assertFalse(thread.is_alive())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,135 +1,199 @@
 """Unit tests for the GestureDetector class."""
 
-import unittest
-from unittest.mock import Mock, patch
+import functools
+from types import SimpleNamespace
+from typing import Dict, Tuple
 
-import mediapipe as mp
 import numpy as np
+import pytest
 
 from hand_gesture_game.core.gesture_detector import Gesture, GestureDetector
 from hand_gesture_game.exceptions.game_exceptions import GestureDetectionError
 
-
-class TestGestureDetector(unittest.TestCase):
-    """Test cases for the GestureDetector class."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.detector = GestureDetector()
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.detector = None
-
-    def create_mock_landmark(self, x: float, y: float, z: float = 0.0) -> Mock:
-        """Create a mock landmark with given coordinates."""
-        landmark = Mock()
-        landmark.x = x
-        landmark.y = y
-        landmark.z = z
-        return landmark
-
-    def test_init_default_values(self):
-        """Test initialization with default values."""
-        self.assertEqual(self.detector.min_detection_confidence, 0.7)
-        self.assertEqual(self.detector.min_tracking_confidence, 0.7)
-
-    def test_rock_gesture_detection(self):
-        """Test detection of rock gesture (closed fist)."""
-        # Mock landmarks for closed fist
-        landmarks = Mock()
-        landmarks.landmark = {
-            # Finger tips (all below bases)
-            4: self.create_mock_landmark(0.5, 0.6),  # thumb
-            8: self.create_mock_landmark(0.5, 0.6),  # index
-            12: self.create_mock_landmark(0.5, 0.6),  # middle
-            16: self.create_mock_landmark(0.5, 0.6),  # ring
-            20: self.create_mock_landmark(0.5, 0.6),  # pinky
-            # Finger bases
-            2: self.create_mock_landmark(0.4, 0.5),  # thumb
-            5: self.create_mock_landmark(0.5, 0.5),  # index
-            9: self.create_mock_landmark(0.5, 0.5),  # middle
-            13: self.create_mock_landmark(0.5, 0.5),  # ring
-            17: self.create_mock_landmark(0.5, 0.5),  # pinky
-        }
-
-        gesture = self.detector.detect_gesture(landmarks)
-        self.assertEqual(gesture, Gesture.ROCK)
-
-    def test_paper_gesture_detection(self):
-        """Test detection of paper gesture (open palm)."""
-        # Mock landmarks for open palm
-        landmarks = Mock()
-        landmarks.landmark = {
-            # Finger tips (all above bases)
-            4: self.create_mock_landmark(0.3, 0.4),  # thumb
-            8: self.create_mock_landmark(0.5, 0.4),  # index
-            12: self.create_mock_landmark(0.5, 0.4),  # middle
-            16: self.create_mock_landmark(0.5, 0.4),  # ring
-            20: self.create_mock_landmark(0.7, 0.4),  # pinky
-            # Finger bases
-            2: self.create_mock_landmark(0.4, 0.5),  # thumb
-            5: self.create_mock_landmark(0.5, 0.5),  # index
-            9: self.create_mock_landmark(0.5, 0.5),  # middle
-            13: self.create_mock_landmark(0.5, 0.5),  # ring
-            17: self.create_mock_landmark(0.5, 0.5),  # pinky
-        }
-
-        gesture = self.detector.detect_gesture(landmarks)
-        self.assertEqual(gesture, Gesture.PAPER)
-
-    def test_scissors_gesture_detection(self):
-        """Test detection of scissors gesture (victory sign)."""
-        # Mock landmarks for scissors gesture
-        landmarks = Mock()
-        landmarks.landmark = {
-            # Finger tips (index and middle up, others down)
-            4: self.create_mock_landmark(0.5, 0.6),  # thumb down
-            8: self.create_mock_landmark(0.5, 0.4),  # index up
-            12: self.create_mock_landmark(0.5, 0.4),  # middle up
-            16: self.create_mock_landmark(0.5, 0.6),  # ring down
-            20: self.create_mock_landmark(0.5, 0.6),  # pinky down
-            # Finger bases
-            2: self.create_mock_landmark(0.4, 0.5),  # thumb
-            5: self.create_mock_landmark(0.5, 0.5),  # index
-            9: self.create_mock_landmark(0.5, 0.5),  # middle
-            13: self.create_mock_landmark(0.5, 0.5),  # ring
-            17: self.create_mock_landmark(0.5, 0.5),  # pinky
-        }
-
-        gesture = self.detector.detect_gesture(landmarks)
-        self.assertEqual(gesture, Gesture.SCISSORS)
-
-    def test_invalid_gesture_detection(self):
-        """Test detection of invalid gesture."""
-        # Mock landmarks for invalid gesture (three fingers up)
-        landmarks = Mock()
-        landmarks.landmark = {
-            # Finger tips (index, middle, and ring up, others down)
-            4: self.create_mock_landmark(0.5, 0.6),  # thumb down
-            8: self.create_mock_landmark(0.5, 0.4),  # index up
-            12: self.create_mock_landmark(0.5, 0.4),  # middle up
-            16: self.create_mock_landmark(0.5, 0.4),  # ring up
-            20: self.create_mock_landmark(0.5, 0.6),  # pinky down
-            # Finger bases
-            2: self.create_mock_landmark(0.4, 0.5),  # thumb
-            5: self.create_mock_landmark(0.5, 0.5),  # index
-            9: self.create_mock_landmark(0.5, 0.5),  # middle
-            13: self.create_mock_landmark(0.5, 0.5),  # ring
-            17: self.create_mock_landmark(0.5, 0.5),  # pinky
-        }
-
-        gesture = self.detector.detect_gesture(landmarks)
-        self.assertIsNone(gesture)
-
-    def test_error_handling(self):
-        """Test error handling for invalid landmarks."""
-        landmarks = Mock()
-        landmarks.landmark = {}  # Empty landmarks
-
-        with self.assertRaises(GestureDetectionError):
-            self.detector.detect_gesture(landmarks)
-
-
-if __name__ == "__main__":
-    unittest.main()
+Point = Tuple[float, float, float]
+
+
+class LM:
+    """Minimal stand-in for a MediaPipe landmark with x/y/z coordinates."""
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float, y: float, z: float = 0.0) -> None:
+        """Store the landmark coordinates."""
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+@functools.lru_cache(maxsize=None)
+def _lm(x: float, y: float, z: float = 0.0) -> LM:
+    """Return the shared landmark for the given coordinates (never mutated)."""
+    return LM(x, y, z)
+
+
+def lm_namespace(pairs: Dict[int, Point]) -> SimpleNamespace:
+    """Build a landmarks object whose ``landmark`` list mirrors MediaPipe's 21 ids."""
+    lmlist = [_lm(0.0, 0.0)] * 21
+    for i, point in pairs.items():
+        lmlist[i] = _lm(*point)
+    return SimpleNamespace(landmark=lmlist)
+
+
+def lm_array(pairs: Dict[int, Point]) -> np.ndarray:
+    """Build a (21, 3) float32 landmark array, zero where not given."""
+    a = np.zeros((21, 3), np.float32)
+    for i, point in pairs.items():
+        a[i] = point
+    return a
+
+
+# Landmarks for closed fist
+ROCK_POINTS = {
+    # Finger tips (all below bases)
+    4: (0.5, 0.6, 0.0),  # thumb
+    8: (0.5, 0.6, 0.0),  # index
+    12: (0.5, 0.6, 0.0),  # middle
+    16: (0.5, 0.6, 0.0),  # ring
+    20: (0.5, 0.6, 0.0),  # pinky
+    # Finger bases
+    2: (0.4, 0.5, 0.0),  # thumb
+    5: (0.5, 0.5, 0.0),  # index
+    9: (0.5, 0.5, 0.0),  # middle
+    13: (0.5, 0.5, 0.0),  # ring
+    17: (0.5, 0.5, 0.0),  # pinky
+}
+
+# Landmarks for open palm
+PAPER_POINTS = {
+    # Finger tips (all above bases)
+    4: (0.3, 0.4, 0.0),  # thumb
+    8: (0.5, 0.4, 0.0),  # index
+    12: (0.5, 0.4, 0.0),  # middle
+    16: (0.5, 0.4, 0.0),  # ring
+    20: (0.7, 0.4, 0.0),  # pinky
+    # Finger bases
+    2: (0.4, 0.5, 0.0),  # thumb
+    5: (0.5, 0.5, 0.0),  # index
+    9: (0.5, 0.5, 0.0),  # middle
+    13: (0.5, 0.5, 0.0),  # ring
+    17: (0.5, 0.5, 0.0),  # pinky
+}
+
+# Landmarks for scissors gesture
+SCISSORS_POINTS = {
+    # Finger tips (index and middle up, others down)
+    4: (0.5, 0.6, 0.0),  # thumb down
+    8: (0.5, 0.4, 0.0),  # index up
+    12: (0.5, 0.4, 0.0),  # middle up
+    16: (0.5, 0.6, 0.0),  # ring down
+    20: (0.5, 0.6, 0.0),  # pinky down
+    # Finger bases
+    2: (0.4, 0.5, 0.0),  # thumb
+    5: (0.5, 0.5, 0.0),  # index
+    9: (0.5, 0.5, 0.0),  # middle
+    13: (0.5, 0.5, 0.0),  # ring
+    17: (0.5, 0.5, 0.0),  # pinky
+}
+
+# Landmarks for invalid gesture (three fingers up)
+INVALID_POINTS = {
+    # Finger tips (index, middle, and ring up, others down)
+    4: (0.5, 0.6, 0.0),  # thumb down
+    8: (0.5, 0.4, 0.0),  # index up
+    12: (0.5, 0.4, 0.0),  # middle up
+    16: (0.5, 0.4, 0.0),  # ring up
+    20: (0.5, 0.6, 0.0),  # pinky down
+    # Finger bases
+    2: (0.4, 0.5, 0.0),  # thumb
+    5: (0.5, 0.5, 0.0),  # index
+    9: (0.5, 0.5, 0.0),  # middle
+    13: (0.5, 0.5, 0.0),  # ring
+    17: (0.5, 0.5, 0.0),  # pinky
+}
+
+ROCK_LM = lm_namespace(ROCK_POINTS)
+PAPER_LM = lm_namespace(PAPER_POINTS)
+SCISSORS_LM = lm_namespace(SCISSORS_POINTS)
+INVALID_LM = lm_namespace(INVALID_POINTS)
+
+ROCK_ARR = lm_array(ROCK_POINTS)
+PAPER_ARR = lm_array(PAPER_POINTS)
+SCISSORS_ARR = lm_array(SCISSORS_POINTS)
+INVALID_ARR = lm_array(INVALID_POINTS)
+
+GESTURE_CASES = [
+    ("rock", ROCK_LM, Gesture.ROCK),
+    ("paper", PAPER_LM, Gesture.PAPER),
+    ("scissors", SCISSORS_LM, Gesture.SCISSORS),
+    ("invalid", INVALID_LM, None),
+    ("rock_array", ROCK_ARR, Gesture.ROCK),
+    ("paper_array", PAPER_ARR, Gesture.PAPER),
+    ("scissors_array", SCISSORS_ARR, Gesture.SCISSORS),
+    ("invalid_array", INVALID_ARR, None),
+]
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """Provide a GestureDetector shared by all tests."""
+    shared = GestureDetector()
+    yield shared
+    shared.close()
+
+
+@pytest.fixture
+def fresh_detector():
+    """Provide a GestureDetector owned by a single test."""
+    owned = GestureDetector()
+    yield owned
+    owned.close()
+
+
+def test_init_default_values(detector):
+    """Test initialization with default values."""
+    assert detector.min_detection_confidence == 0.7
+    assert detector.min_tracking_confidence == 0.7
+
+
+@pytest.mark.parametrize(
+    "name,lm,expected", GESTURE_CASES, ids=[case[0] for case in GESTURE_CASES]
+)
+def test_detect(detector, name, lm, expected):
+    """Test detection of each gesture scenario."""
+    assert detector.detect_gesture(lm) == expected
+
+
+@pytest.mark.parametrize(
+    "fingers_extended,expected",
+    [
+        ([False, False, False, False, False], Gesture.ROCK),
+        ([True, False, False, False, False], Gesture.ROCK),
+        ([False, True, True, False, False], Gesture.SCISSORS),
+        ([True, True, True, False, False], None),
+        ([False, True, False, True, False], None),
+        ([False, True, True, True, True], Gesture.PAPER),
+        ([True, True, True, True, True], Gesture.PAPER),
+    ],
+)
+def test_classify_gesture_patterns(detector, fingers_extended, expected):
+    """Test classification of finger patterns via the lookup table."""
+    assert detector._classify_gesture(np.array(fingers_extended)) == expected
+
+
+def test_close(fresh_detector):
+    """Test closing the detector releases MediaPipe and is idempotent."""
+    with fresh_detector as detector:
+        assert detector.hands is not None
+    assert detector.hands is None
+    detector.close()
+
+
+def test_error_handling(detector):
+    """Test error handling for invalid landmarks."""
+    landmarks = SimpleNamespace(landmark=[])  # Empty landmarks
+
+    with pytest.raises(GestureDetectionError):
+        detector.detect_gesture(landmarks)
+
+    with pytest.raises(GestureDetectionError):
+        detector.detect_gesture(np.zeros((0, 3), np.float32))
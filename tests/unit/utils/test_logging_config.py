@@ -0,0 +1,47 @@
+"""Unit tests for the logging configuration."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from hand_gesture_game.utils.logging_config import (
+    get_logger,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def app_logger():
+    """Restore the application logger's handlers after the test."""
+    logger = logging.getLogger("hand_gesture_game")
+    handlers = list(logger.handlers)
+    level = logger.level
+    yield logger
+    shutdown_logging()
+    for handler in logger.handlers[:]:
+        if handler not in handlers:
+            logger.removeHandler(handler)
+    logger.setLevel(level)
+
+
+def test_shutdown_flushes_records_to_file(app_logger, tmp_path):
+    """Test queued records reach the log file once logging is shut down."""
+    log_file = tmp_path / "logs" / "game.log"
+    setup_logging(str(log_file))
+    get_logger("test").info("round finished")
+    shutdown_logging()
+
+    assert "round finished" in log_file.read_text()
+
+
+def test_setup_replaces_queue_handler(app_logger, tmp_path):
+    """Test setting up logging again leaves a single queue handler attached."""
+    setup_logging(str(tmp_path / "first.log"))
+    setup_logging(str(tmp_path / "second.log"))
+    queue_handlers = [h for h in app_logger.handlers if isinstance(h, QueueHandler)]
+    assert len(queue_handlers) == 1
+
+    shutdown_logging()
+    assert not any(isinstance(h, QueueHandler) for h in app_logger.handlers)